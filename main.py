@@ -19,91 +19,179 @@ status during extended periods of inactivity. Please ensure compliance with
 your organization's policies and terms of service.
 """
 
+import atexit
+import functools
 import math
 import random
 import time
 import sys
 import platform
+import shutil
 import subprocess
 
 # Import configuration
 import config
 
+# Resolve the platform once; it cannot change while the script runs
+_SYSTEM = platform.system()
+
 # Platform-specific imports
-if platform.system() == "Windows":
+if _SYSTEM == "Windows":
     import win32api
     import win32con
-elif platform.system() == "Linux":
+elif _SYSTEM == "Linux":
     try:
         import Xlib.display
+        from Xlib import X
+        from Xlib.ext import xtest
     except ImportError:
         print("Error: python-xlib not installed. Install with: pip install python-xlib")
         sys.exit(1)
+elif _SYSTEM == "Darwin":
+    try:
+        from Quartz import (
+            CGDisplayPixelsHigh,
+            CGDisplayPixelsWide,
+            CGEventCreate,
+            CGEventCreateMouseEvent,
+            CGEventGetLocation,
+            CGEventPost,
+            CGMainDisplayID,
+            CGPointMake,
+            kCGEventMouseMoved,
+            kCGHIDEventTap,
+            kCGMouseButtonLeft,
+        )
+    except ImportError:
+        print("Error: pyobjc Quartz not installed. Install with: pip install pyobjc-framework-Quartz")
+        sys.exit(1)
 
 
 class MouseController:
     """Cross-platform mouse controller"""
 
     def __init__(self):
-        self.system = platform.system()
-        if self.system == "Linux":
-            self.display = Xlib.display.Display()
-            self.screen = self.display.screen()
-            self.root = self.screen.root
-
-    def get_cursor_pos(self) -> tuple[int, int]:
-        """Get current mouse position"""
-        if self.system == "Windows":
-            return win32api.GetCursorPos()
-        elif self.system == "Linux":
-            try:
-                query = self.root.query_pointer()
-                return query.root_x, query.root_y
-            except Xlib.error.ConnectionClosedError:
-                # Reconnect if display connection is closed
-                self.display = Xlib.display.Display()
-                self.screen = self.display.screen()
-                self.root = self.screen.root
-                query = self.root.query_pointer()
-                return query.root_x, query.root_y
-        elif self.system == "Darwin":  # macOS
-            # Use AppleScript to get cursor position (more reliable)
-            try:
-                result = subprocess.run([
-                    'osascript', '-e',
-                    'tell application "System Events" to get position of mouse'
-                ], capture_output=True, text=True, check=True)
-                x, y = map(int, result.stdout.strip().split(', '))
-                return x, y
-            except (subprocess.CalledProcessError, ValueError):
-                # Fallback to a default position
-                return (500, 500)
-
-    def set_cursor_pos(self, x: int, y: int) -> None:
-        """Set mouse position"""
+        self.system = _SYSTEM
+        self._screen_dims: tuple[int, int] | None = None
+
+        # Bind the platform implementations once instead of dispatching on
+        # self.system for every cursor update:
+        #   get_cursor_pos() -> (x, y): current mouse position
+        #   set_cursor_pos(x, y): move the mouse and wait until it has moved
+        #   set_cursor_pos_batched(x, y): move the mouse without waiting
+        #   sync(): wait until all batched moves have been processed
         if self.system == "Windows":
-            win32api.SetCursorPos((x, y))
+            self.get_cursor_pos = self._get_cursor_pos_windows
+            self.set_cursor_pos = self._set_cursor_pos_windows
+            self.set_cursor_pos_batched = self._set_cursor_pos_windows
+            self.sync = self._sync_noop
         elif self.system == "Linux":
-            # Use xdotool for Linux
-            try:
-                subprocess.run(['xdotool', 'mousemove', str(x), str(y)],
-                             check=False, capture_output=True)
-            except FileNotFoundError:
-                print("Error: xdotool not found. Install with: sudo apt-get install xdotool")
-                raise
+            self.get_cursor_pos = self._get_cursor_pos_linux
+            self._connect_display()
         elif self.system == "Darwin":  # macOS
-            # Use AppleScript for macOS (more reliable than CGWarpMouseCursorPosition)
-            try:
-                subprocess.run([
-                    'osascript', '-e',
-                    f'tell application "System Events" to set position of mouse to {{{x}, {y}}}'
-                ], check=True, capture_output=True)
-            except subprocess.CalledProcessError:
-                print("Error: Could not move mouse on macOS. Make sure accessibility permissions are granted.")
-                raise
+            self.get_cursor_pos = self._get_cursor_pos_darwin
+            self.set_cursor_pos = self._set_cursor_pos_darwin
+            self.set_cursor_pos_batched = self._set_cursor_pos_darwin
+            self.sync = self._sync_noop
+        else:
+            raise RuntimeError(f"Unsupported platform: {self.system}")
+
+    def _connect_display(self) -> None:
+        """Open the X display and check for the XTEST extension"""
+        self.display = Xlib.display.Display()
+        self.screen = self.display.screen()
+        self.root = self.screen.root
+        # XTEST lets us move the pointer on the open connection; without it
+        # we fall back to spawning xdotool for every step
+        self.has_xtest = self.display.query_extension('XTEST') is not None
+        if self.has_xtest:
+            self.set_cursor_pos = self._set_cursor_pos_xtest
+            self.set_cursor_pos_batched = self._set_cursor_pos_xtest_batched
+            self.sync = self._sync_xtest
+        else:
+            self.set_cursor_pos = self._set_cursor_pos_xdotool
+            self.set_cursor_pos_batched = self._set_cursor_pos_xdotool
+            self.sync = self._sync_noop
+
+    def _get_cursor_pos_windows(self) -> tuple[int, int]:
+        return win32api.GetCursorPos()
+
+    def _get_cursor_pos_linux(self) -> tuple[int, int]:
+        try:
+            query = self.root.query_pointer()
+        except Xlib.error.ConnectionClosedError:
+            # Reconnect if display connection is closed
+            self._connect_display()
+            query = self.root.query_pointer()
+        return query.root_x, query.root_y
+
+    def _get_cursor_pos_darwin(self) -> tuple[int, int]:
+        location = CGEventGetLocation(CGEventCreate(None))
+        return int(location.x), int(location.y)
+
+    def _set_cursor_pos_windows(self, x: int, y: int) -> None:
+        win32api.SetCursorPos((x, y))
+
+    def _set_cursor_pos_xtest(self, x: int, y: int) -> None:
+        try:
+            xtest.fake_input(self.display, X.MotionNotify, x=x, y=y)
+            self.display.sync()
+        except Xlib.error.ConnectionClosedError:
+            # Reconnect if display connection is closed
+            self._connect_display()
+            self.set_cursor_pos(x, y)
+
+    def _set_cursor_pos_xtest_batched(self, x: int, y: int) -> None:
+        try:
+            xtest.fake_input(self.display, X.MotionNotify, x=x, y=y)
+            self.display.flush()
+        except Xlib.error.ConnectionClosedError:
+            # Reconnect if display connection is closed
+            self._connect_display()
+            self.set_cursor_pos_batched(x, y)
+
+    def _set_cursor_pos_xdotool(self, x: int, y: int) -> None:
+        # Fall back to xdotool when XTEST is unavailable
+        try:
+            subprocess.run(['xdotool', 'mousemove', str(x), str(y)],
+                         check=False, capture_output=True)
+        except FileNotFoundError:
+            print("Error: xdotool not found. Install with: sudo apt-get install xdotool")
+            raise
+
+    def _set_cursor_pos_darwin(self, x: int, y: int) -> None:
+        # Post a real mouse-moved event; a bare cursor warp is not seen
+        # as user activity by most applications
+        event = CGEventCreateMouseEvent(
+            None, kCGEventMouseMoved, CGPointMake(x, y), kCGMouseButtonLeft
+        )
+        CGEventPost(kCGHIDEventTap, event)
+
+    def _sync_xtest(self) -> None:
+        try:
+            self.display.sync()
+        except Xlib.error.ConnectionClosedError:
+            # Nothing left to wait for on a closed connection; reconnect
+            self._connect_display()
+
+    def _sync_noop(self) -> None:
+        # Cursor updates on this backend complete before they return
+        pass
 
     def get_screen_dimensions(self) -> tuple[int, int]:
-        """Get screen dimensions"""
+        """Get screen dimensions (probed once, then cached)"""
+        if self._screen_dims is None:
+            self._screen_dims = self._probe_screen_dimensions()
+        return self._screen_dims
+
+    def refresh_screen_dimensions(self) -> tuple[int, int]:
+        """Re-probe screen dimensions, e.g. after a display change"""
+        self._screen_dims = None
+        get_screen_bounds.cache_clear()  # Bounds are derived from the dimensions
+        return self.get_screen_dimensions()
+
+    def _probe_screen_dimensions(self) -> tuple[int, int]:
+        """Query the platform for the current screen dimensions"""
         if self.system == "Windows":
             screen_width = win32api.GetSystemMetrics(win32con.SM_CXSCREEN)
             screen_height = win32api.GetSystemMetrics(win32con.SM_CYSCREEN)
@@ -111,26 +199,19 @@ class MouseController:
         elif self.system == "Linux":
             return self.screen.width_in_pixels, self.screen.height_in_pixels
         elif self.system == "Darwin":  # macOS
-            # Use system_profiler to get screen dimensions
-            try:
-                result = subprocess.run([
-                    'system_profiler', 'SPDisplaysDataType'
-                ], capture_output=True, text=True, check=True)
-
-                # Parse the output to find resolution
-                lines = result.stdout.split('\n')
-                for line in lines:
-                    if 'Resolution' in line:
-                        resolution = line.split(':')[1].strip()
-                        if 'x' in resolution:
-                            width, height = map(int, resolution.split(' x '))
-                            return width, height
-
-                # Fallback to common resolution
-                return 1440, 900
-            except (subprocess.CalledProcessError, ValueError, IndexError):
-                # Fallback to common resolution
-                return 1440, 900
+            display_id = CGMainDisplayID()
+            return CGDisplayPixelsWide(display_id), CGDisplayPixelsHigh(display_id)
+
+
+_CONTROLLER: MouseController | None = None
+
+
+def _controller() -> MouseController:
+    """Return the shared MouseController, creating it on first use"""
+    global _CONTROLLER
+    if _CONTROLLER is None:
+        _CONTROLLER = MouseController()
+    return _CONTROLLER
 
 
 def get_screen_dimensions() -> tuple[int, int]:
@@ -141,19 +222,22 @@ def get_screen_dimensions() -> tuple[int, int]:
         tuple[int, int]: A tuple containing (width, height) of the primary
         screen in pixels.
     """
-    controller = MouseController()
-    return controller.get_screen_dimensions()
+    return _controller().get_screen_dimensions()
 
 
+@functools.lru_cache(maxsize=1)
 def get_screen_bounds() -> tuple[int, int, int, int]:
     """
     Calculate screen boundaries based on margin configuration.
 
+    The result is cached. MouseController.refresh_screen_dimensions()
+    clears it; call get_screen_bounds.cache_clear() directly after changing
+    only the screen margin settings.
+
     Returns:
         tuple[int, int, int, int]: (min_x, min_y, max_x, max_y) boundaries
     """
-    controller = MouseController()
-    screen_width, screen_height = controller.get_screen_dimensions()
+    screen_width, screen_height = get_screen_dimensions()
 
     if not config.ENABLE_SCREEN_SAFE_ZONE:
         return 0, 0, screen_width, screen_height
@@ -221,35 +305,99 @@ def get_small_movement_position(current_x: int, current_y: int) -> tuple[int, in
     Returns:
         tuple[int, int]: New position within small movement range
     """
-    controller = MouseController()
-    screen_width, screen_height = controller.get_screen_dimensions()
+    screen_width, screen_height = get_screen_dimensions()
+    min_distance, max_distance = config.SMALL_MOVEMENT_RANGE
+
+    # Sample uniformly over the ring between the min and max distance. The
+    # inner radius is padded by a pixel so rounding each offset to whole
+    # pixels (at most ~0.71px in total) cannot pull the move under the minimum
+    distance = math.sqrt(random.uniform((min_distance + 1)**2, max_distance**2))
+    angle = random.uniform(0, 2 * math.pi)
+    offset_x = round(distance * math.cos(angle))
+    offset_y = round(distance * math.sin(angle))
+
+    # Mirror an offset that would leave the screen; unlike clamping this
+    # keeps the distance of the move
+    if not 0 <= current_x + offset_x < screen_width:
+        offset_x = -offset_x
+    if not 0 <= current_y + offset_y < screen_height:
+        offset_y = -offset_y
+
+    # Clamp only as a last resort, for screens smaller than the movement range
+    target_x = min(max(current_x + offset_x, 0), screen_width - 1)
+    target_y = min(max(current_y + offset_y, 0), screen_height - 1)
+    return target_x, target_y
+
+
+def bezier_curve(p0: float, p1: float, p2: float, p3: float, steps: int) -> list[float]:
+    """
+    Evaluate a one-dimensional cubic Bezier curve at evenly spaced points.
 
-    # Calculate small movement boundaries
-    min_x = max(0, current_x - config.SMALL_MOVEMENT_RANGE[1])
-    max_x = min(screen_width, current_x + config.SMALL_MOVEMENT_RANGE[1])
-    min_y = max(0, current_y - config.SMALL_MOVEMENT_RANGE[1])
-    max_y = min(screen_height, current_y + config.SMALL_MOVEMENT_RANGE[1])
+    Args:
+        p0 (float): Start coordinate
+        p1 (float): First control point coordinate
+        p2 (float): Second control point coordinate
+        p3 (float): End coordinate
+        steps (int): Number of intervals; steps + 1 points are returned
 
-    # Ensure movement is at least the minimum distance
-    while True:
-        target_x, target_y = get_next_position(max_x, max_y, min_x, min_y)
-        distance = math.sqrt((target_x - current_x)**2 + (target_y - current_y)**2)
-        if distance >= config.SMALL_MOVEMENT_RANGE[0]:
-            return target_x, target_y
+    Returns:
+        list[float]: Curve coordinates for t = 0, 1/steps, ..., 1
+    """
+    # Polynomial form: a*t^3 + b*t^2 + c*t + p0
+    a = p3 - p0 + 3 * (p1 - p2)
+    b = 3 * (p0 - 2 * p1 + p2)
+    c = 3 * (p1 - p0)
+
+    # Forward differences for a fixed step h, so each point costs 3 additions
+    h = 1 / steps
+    h2 = h * h
+    h3 = h2 * h
+    x = p0
+    dx = a * h3 + b * h2 + c * h
+    d2x = 6 * a * h3 + 2 * b * h2
+    d3x = 6 * a * h3
+
+    points = []
+    append = points.append
+    for _ in range(steps):
+        append(x)
+        x += dx
+        dx += d2x
+        d2x += d3x
+    append(p3)  # Land exactly on the end point despite rounding drift
+    return points
+
+
+def draw_jitter(count: int) -> tuple[list[int], list[int]]:
+    """
+    Draw per-step jitter offsets for a whole movement in one go.
 
+    Args:
+        count (int): Number of steps that need an offset
 
-def linear_mouse_move(target_x: int, target_y: int) -> None:
+    Returns:
+        tuple[list[int], list[int]]: X and Y offsets, all zero when jitter
+        is disabled in config
     """
-    Move mouse from current position to target in a straight line.
+    if not config.ENABLE_JITTER:
+        zeros = [0] * count
+        return zeros, zeros
+
+    offsets = range(-config.JITTER_INTENSITY, config.JITTER_INTENSITY + 1)
+    return random.choices(offsets, k=count), random.choices(offsets, k=count)
+
+
+def linear_mouse_move(start_x: int, start_y: int, target_x: int, target_y: int) -> None:
+    """
+    Move mouse from start position to target in a straight line.
 
     Args:
+        start_x (int): Current X coordinate of the mouse
+        start_y (int): Current Y coordinate of the mouse
         target_x (int): Target X coordinate
         target_y (int): Target Y coordinate
     """
-    controller = MouseController()
-
-    # Get current mouse position
-    start_x, start_y = controller.get_cursor_pos()
+    controller = _controller()
 
     # Use config values
     step_interval = random.uniform(*config.LINEAR_STEP_INTERVAL_RANGE)
@@ -259,34 +407,47 @@ def linear_mouse_move(target_x: int, target_y: int) -> None:
     x_increment = (target_x - start_x) / steps
     y_increment = (target_y - start_y) / steps
 
+    # Jitter offsets for every step, drawn up front
+    jitter_xs, jitter_ys = draw_jitter(steps)
+
+    # Bind hot lookups to locals once, outside the step loop
+    set_pos = controller.set_cursor_pos_batched
+    sleep = time.sleep
+    monotonic = time.monotonic
+
+    # Round to integer pixels before the loop; the timed loop only moves and sleeps
+    points = [
+        (int(start_x + x_increment * step) + jitter_x,
+         int(start_y + y_increment * step) + jitter_y)
+        for step, jitter_x, jitter_y in zip(range(1, steps + 1), jitter_xs, jitter_ys)
+    ]
+
+    # Sleep until fixed deadlines so per-step overhead does not add up
+    deadline = monotonic()
+
     # Move through each intermediate point
-    for step in range(1, steps + 1):
-        current_x = int(start_x + x_increment * step)
-        current_y = int(start_y + y_increment * step)
+    for current_x, current_y in points:
+        set_pos(current_x, current_y)
 
-        # Add jitter if enabled
-        if config.ENABLE_JITTER:
-            jitter_x = random.randint(-config.JITTER_INTENSITY, config.JITTER_INTENSITY)
-            jitter_y = random.randint(-config.JITTER_INTENSITY, config.JITTER_INTENSITY)
-            current_x += jitter_x
-            current_y += jitter_y
+        deadline += step_interval
+        delay = deadline - monotonic()
+        if delay > 0:
+            sleep(delay)
 
-        controller.set_cursor_pos(current_x, current_y)
-        time.sleep(step_interval)
+    controller.sync()
 
 
-def human_like_mouse_move(target_x: int, target_y: int) -> None:
+def human_like_mouse_move(start_x: int, start_y: int, target_x: int, target_y: int) -> None:
     """
-    Move mouse from current position to target with human-like curved movement.
+    Move mouse from start position to target with human-like curved movement.
 
     Args:
+        start_x (int): Current X coordinate of the mouse
+        start_y (int): Current Y coordinate of the mouse
         target_x (int): Target X coordinate
         target_y (int): Target Y coordinate
     """
-    controller = MouseController()
-
-    # Get current mouse position
-    start_x, start_y = controller.get_cursor_pos()
+    controller = _controller()
 
     # Calculate distance for realistic curvature
     dx = target_x - start_x
@@ -312,55 +473,66 @@ def human_like_mouse_move(target_x: int, target_y: int) -> None:
     # Calculate number of steps based on duration and interval
     steps = int(movement_duration / step_interval)
 
-    # Move through Bezier curve points
-    for i in range(steps + 1):
-        t = i / steps
-
-        # Cubic Bezier curve calculation
-        current_x = (
-            (1-t)**3 * start_x +
-            3*(1-t)**2*t * ctrl1_x +
-            3*(1-t)*t**2 * ctrl2_x +
-            t**3 * target_x
-        )
+    # Bind hot lookups to locals once, outside the step loop
+    uniform = random.uniform
+    set_pos = controller.set_cursor_pos_batched
+    sleep = time.sleep
+    monotonic = time.monotonic
 
-        current_y = (
-            (1-t)**3 * start_y +
-            3*(1-t)**2*t * ctrl1_y +
-            3*(1-t)*t**2 * ctrl2_y +
-            t**3 * target_y
-        )
+    # Precompute the whole trajectory so the loop only moves and sleeps
+    xs = bezier_curve(start_x, ctrl1_x, ctrl2_x, target_x, steps)
+    ys = bezier_curve(start_y, ctrl1_y, ctrl2_y, target_y, steps)
+
+    # Subtle human-like jitter for every point, drawn up front
+    jitter_xs, jitter_ys = draw_jitter(steps + 1)
+
+    # Round to integer pixels before the loop; the timed loop only moves and sleeps
+    points = [
+        (int(x + jitter_x), int(y + jitter_y))
+        for x, y, jitter_x, jitter_y in zip(xs, ys, jitter_xs, jitter_ys)
+    ]
 
-        # Add subtle human-like jitter
-        if config.ENABLE_JITTER:
-            jitter_x = random.randint(-config.JITTER_INTENSITY, config.JITTER_INTENSITY)
-            jitter_y = random.randint(-config.JITTER_INTENSITY, config.JITTER_INTENSITY)
-            current_x += jitter_x
-            current_y += jitter_y
+    # Sleep until fixed deadlines so per-step overhead does not add up
+    deadline = monotonic()
 
-        controller.set_cursor_pos(int(current_x), int(current_y))
+    # Move through Bezier curve points
+    for current_x, current_y in points:
+        set_pos(current_x, current_y)
 
         # Variable interval for more natural movement
-        variable_interval = step_interval + random.uniform(-0.005, 0.005)
-        time.sleep(max(0.001, variable_interval))  # Ensure positive interval
+        variable_interval = step_interval + uniform(-0.005, 0.005)
+        deadline += max(0.001, variable_interval)  # Ensure positive interval
+        delay = deadline - monotonic()
+        if delay > 0:
+            sleep(delay)
+
+    controller.sync()
+
+
+# Movement types enabled in config, resolved once at import
+_ENABLED_TYPES = tuple(
+    movement_type
+    for movement_type, enabled in (
+        ('linear', config.USE_LINEAR_MOVEMENT),
+        ('bezier', config.USE_BEZIER_MOVEMENT),
+    )
+    if enabled
+)
+_RANDOMIZE_MOVEMENT_TYPES = config.RANDOMIZE_MOVEMENT_TYPES
 
 
-def choose_movement_type(consecutive_count: dict) -> str:
+def choose_movement_type(last_movement_type: str | None) -> str:
     """
     Choose which movement type to use based on configuration and history.
 
     Args:
-        consecutive_count (dict): Count of consecutive movement types
+        last_movement_type (str | None): Type of the previous movement, or
+        None before the first one
 
     Returns:
         str: Movement type to use ('linear' or 'bezier')
     """
-    # Check which movement types are enabled
-    enabled_types = []
-    if config.USE_LINEAR_MOVEMENT:
-        enabled_types.append('linear')
-    if config.USE_BEZIER_MOVEMENT:
-        enabled_types.append('bezier')
+    enabled_types = _ENABLED_TYPES
 
     if not enabled_types:
         raise ValueError("At least one movement type must be enabled in config")
@@ -368,17 +540,18 @@ def choose_movement_type(consecutive_count: dict) -> str:
     if len(enabled_types) == 1:
         return enabled_types[0]
 
-    if not config.RANDOMIZE_MOVEMENT_TYPES:
+    if not _RANDOMIZE_MOVEMENT_TYPES:
         # Alternate if both are enabled but not randomizing
-        return 'linear' if consecutive_count['linear'] <= consecutive_count['bezier'] else 'bezier'
+        return 'bezier' if last_movement_type == 'linear' else 'linear'
 
     # Random choice between enabled types
     return random.choice(enabled_types)
 
 
+@functools.lru_cache(maxsize=1)
 def check_dependencies() -> bool:
-    """Check if required dependencies are installed for the current platform"""
-    system = platform.system()
+    """Check if required dependencies are installed for the current platform (cached)"""
+    system = _SYSTEM
 
     if system == "Windows":
         try:
@@ -390,27 +563,30 @@ def check_dependencies() -> bool:
             return False
 
     elif system == "Linux":
-        # Check if xdotool is available
+        # Check python-xlib
         try:
-            result = subprocess.run(['which', 'xdotool'], capture_output=True, text=True)
-            if result.returncode != 0:
-                print("Error: xdotool is required for Linux. Install with: sudo apt-get install xdotool")
-                return False
-
-            # Check python-xlib
             import Xlib.display
-            return True
         except ImportError:
             print("Error: python-xlib is required for Linux. Install with: pip install python-xlib")
             return False
 
+        # xdotool is only needed when the X server lacks the XTEST extension
+        try:
+            has_xtest = _controller().has_xtest
+        except Xlib.error.DisplayError as e:
+            print(f"Error: Could not open the X display: {e}")
+            return False
+        if not has_xtest and shutil.which('xdotool') is None:
+            print("Error: xdotool is required for Linux. Install with: sudo apt-get install xdotool")
+            return False
+        return True
+
     elif system == "Darwin":  # macOS
-        # Check if osascript is available (should be on all macOS systems)
         try:
-            subprocess.run(['which', 'osascript'], check=True, capture_output=True)
+            import Quartz
             return True
-        except subprocess.CalledProcessError:
-            print("Error: osascript not found. This should be available on all macOS systems.")
+        except ImportError:
+            print("Error: pyobjc Quartz is required for macOS. Install with: pip install pyobjc-framework-Quartz")
             return False
 
     else:
@@ -418,27 +594,41 @@ def check_dependencies() -> bool:
         return False
 
 
+_SEPARATOR = "-" * 50
+
+
 def main() -> None:
     """
     Main function to run the mouse movement simulator indefinitely.
     """
     print("Mouse Movement Simulator for Availability Maintenance")
-    print(f"Platform: {platform.system()}")
+    print(f"Platform: {_SYSTEM}")
     print("Press Ctrl+C to stop the script")
-    print("-" * 50)
+    print(_SEPARATOR)
 
     # Check dependencies
     if not check_dependencies():
         sys.exit(1)
 
+    if _SYSTEM == "Windows":
+        # Raise the timer resolution from ~15.6ms to 1ms so short step
+        # intervals are not rounded up by time.sleep
+        import ctypes
+        ctypes.windll.winmm.timeBeginPeriod(1)
+        atexit.register(ctypes.windll.winmm.timeEndPeriod, 1)
+
+    # Logging flags, read once for the whole run
+    verbose = config.VERBOSE_LOGGING
+    print_details = config.PRINT_MOVEMENT_DETAILS
+
     # Display current configuration
-    if config.VERBOSE_LOGGING:
+    if verbose:
         print("Configuration:")
         print(f"  Linear movements: {config.USE_LINEAR_MOVEMENT}")
         print(f"  Bezier movements: {config.USE_BEZIER_MOVEMENT}")
         print(f"  Wait time range: {config.WAIT_TIME_RANGE} seconds")
         print(f"  Screen margin: {config.SCREEN_MARGIN}")
-        print("-" * 50)
+        print(_SEPARATOR)
 
     try:
         # Get screen bounds based on configuration
@@ -448,9 +638,10 @@ def main() -> None:
         print(f"Movement area: ({min_x}, {min_y}) to ({max_x}, {max_y})")
 
         movement_count = 0
-        consecutive_count = {'linear': 0, 'bezier': 0}
+        same_type_run = 0
         last_movement_type = None
-        controller = MouseController()
+        both_types_enabled = len(_ENABLED_TYPES) == 2
+        controller = _controller()
 
         while True:
             movement_count += 1
@@ -467,49 +658,40 @@ def main() -> None:
                 target_x, target_y = get_next_position(max_x, max_y, min_x, min_y)
                 movement_size = "normal"
 
-            if config.PRINT_MOVEMENT_DETAILS:
+            if print_details:
                 print(f"Movement {movement_count} ({movement_size}): From ({current_x}, {current_y}) to ({target_x}, {target_y})")
 
             # Choose movement type
-            movement_type = choose_movement_type(consecutive_count)
+            movement_type = choose_movement_type(last_movement_type)
 
-            # Update consecutive count
+            # Update the run length of the current movement type
             if movement_type == last_movement_type:
-                consecutive_count[movement_type] += 1
+                same_type_run += 1
             else:
-                consecutive_count[movement_type] = 1
-                # Reset the other type's count
-                other_type = 'bezier' if movement_type == 'linear' else 'linear'
-                consecutive_count[other_type] = 0
+                same_type_run = 1
 
             # Ensure we don't exceed max consecutive same type
-            if consecutive_count[movement_type] > config.MAX_CONSECUTIVE_SAME_TYPE:
-                # Switch to the other enabled type
-                if movement_type == 'linear' and config.USE_BEZIER_MOVEMENT:
-                    movement_type = 'bezier'
-                elif movement_type == 'bezier' and config.USE_LINEAR_MOVEMENT:
-                    movement_type = 'linear'
-                consecutive_count[movement_type] = 1
-                # Reset the other type
-                other_type = 'bezier' if movement_type == 'linear' else 'linear'
-                consecutive_count[other_type] = 0
+            if same_type_run > config.MAX_CONSECUTIVE_SAME_TYPE and both_types_enabled:
+                # Switch to the other type
+                movement_type = 'bezier' if movement_type == 'linear' else 'linear'
+                same_type_run = 1
 
             last_movement_type = movement_type
 
             # Execute movement
             if movement_type == 'linear':
-                linear_mouse_move(target_x, target_y)
+                linear_mouse_move(current_x, current_y, target_x, target_y)
             else:
-                human_like_mouse_move(target_x, target_y)
+                human_like_mouse_move(current_x, current_y, target_x, target_y)
 
-            if config.PRINT_MOVEMENT_DETAILS:
+            if print_details:
                 print(f"Completed {movement_type} movement to ({target_x}, {target_y})")
 
             # Wait time between movements
             wait_time = random.randint(*config.WAIT_TIME_RANGE)
-            if config.VERBOSE_LOGGING:
+            if verbose:
                 print(f"Waiting {wait_time} seconds until next movement...")
-                print("-" * 50)
+                print(_SEPARATOR)
 
             time.sleep(wait_time)
 